@@ -7,9 +7,11 @@ including authentication, session management, and automatic session refresh.
 from __future__ import annotations
 
 import logging
+import threading
 from typing import TYPE_CHECKING, Any
 
 import httpx
+import orjson
 
 __all__ = [
     "MetabaseAPIError",
@@ -71,7 +73,7 @@ class BaseClient:
     def __init__(self, config: AuthConfig):
         self.config = config
         self._client: httpx.Client | None = None
-        self._refreshing_session: bool = False
+        self._client_lock = threading.Lock()
         self.request_count: int = 0
 
     @property
@@ -94,87 +96,108 @@ class BaseClient:
         raise AuthenticationError(f"Unknown auth method: {self.config.auth_method}")
 
     def _get_client(self) -> httpx.Client:
-        """Get or create the HTTP client."""
-        if self._client is None:
-            self._client = httpx.Client(
-                base_url=self.base_url,
-                headers={
-                    "Content-Type": "application/json",
-                    **self._get_auth_headers(),
-                },
-                timeout=HTTP_TIMEOUT_SECONDS,
-            )
-        return self._client
+        """Get or create the HTTP client.
 
-    def _reset_client(self) -> None:
-        """Reset the HTTP client to pick up new auth headers."""
-        if self._client is not None:
-            self._client.close()
-            self._client = None
+        The client is shared by all requests in the process so TLS handshakes
+        are paid once and keep-alive connections are reused across the
+        per-card calls made by dashboard export/import. The lock keeps
+        concurrent first requests (the import thread pool) from each
+        constructing and leaking their own httpx.Client.
+        """
+        client = self._client
+        if client is None:
+            with self._client_lock:
+                client = self._client
+                if client is None:
+                    client = self._client = httpx.Client(
+                        base_url=self.base_url,
+                        headers={
+                            "Content-Type": "application/json",
+                            **self._get_auth_headers(),
+                        },
+                        timeout=HTTP_TIMEOUT_SECONDS,
+                        # A user-supplied transport bypasses Client's own pool
+                        # setup, so the limits must be configured on it directly
+                        transport=httpx.HTTPTransport(
+                            retries=3,
+                            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+                        ),
+                    )
+        return client
 
     def _refresh_session(self) -> bool:
         """Attempt to refresh the session using stored credentials.
 
+        Serialized behind the client lock: when several pool threads hit
+        401 at once, one performs the login while the rest wait and then
+        simply retry with the session it installed. The lock also means
+        no other thread can be constructing the shared httpx.Client while
+        the winner resets it.
+
         Returns:
-            True if refresh was successful, False otherwise.
+            True if a fresh session is available (refreshed here or by a
+            concurrent caller), False otherwise.
         """
-        if self._refreshing_session:
-            return False
-
         if self.config.auth_method != AuthMethod.CREDENTIALS:
             return False
 
         if not self.config.username or not self.config.password:
             return False
 
-        self._refreshing_session = True
-        try:
-            logger.debug("Attempting to refresh session with stored credentials")
-
-            # Login with credentials to get a new session
-            response = httpx.post(
-                f"{self.base_url}/session",
-                json={
-                    "username": self.config.username,
-                    "password": self.config.password,
-                },
-                headers={"Content-Type": "application/json"},
-                timeout=HTTP_TIMEOUT_SECONDS,
-            )
+        stale_session_id = self.config.session_id
+        with self._client_lock:
+            if self.config.session_id != stale_session_id:
+                # A concurrent caller already refreshed while we waited
+                return True
+
+            try:
+                logger.debug("Attempting to refresh session with stored credentials")
+
+                # Login with credentials to get a new session
+                response = httpx.post(
+                    f"{self.base_url}/session",
+                    json={
+                        "username": self.config.username,
+                        "password": self.config.password,
+                    },
+                    headers={"Content-Type": "application/json"},
+                    timeout=HTTP_TIMEOUT_SECONDS,
+                )
 
-            if response.status_code != 200:
-                logger.warning("Failed to refresh session: %s", response.status_code)
-                return False
+                if response.status_code != 200:
+                    logger.warning("Failed to refresh session: %s", response.status_code)
+                    return False
 
-            data = response.json()
-            new_session_id = data.get("id")
-            if not new_session_id:
-                logger.warning("No session ID in refresh response")
-                return False
+                data = response.json()
+                new_session_id = data.get("id")
+                if not new_session_id:
+                    logger.warning("No session ID in refresh response")
+                    return False
 
-            # Update config and persist
-            self.config.session_id = new_session_id
-            self._reset_client()
+                # Update config and drop the client built with the old
+                # session; the lock is already held, so close directly
+                self.config.session_id = new_session_id
+                if self._client is not None:
+                    self._client.close()
+                    self._client = None
 
-            # Save the new session to config file
-            from ..config import update_session_id
+                # Save the new session to config file
+                from ..config import update_session_id
 
-            update_session_id(new_session_id, self.config.profile)
+                update_session_id(new_session_id, config=self.config)
 
-            logger.debug("Session refreshed successfully")
-            return True
-        except Exception as e:
-            logger.warning("Failed to refresh session: %s", e)
-            return False
-        finally:
-            self._refreshing_session = False
+                logger.debug("Session refreshed successfully")
+                return True
+            except Exception as e:
+                logger.warning("Failed to refresh session: %s", e)
+                return False
 
     def _safe_json(self, response: httpx.Response) -> dict | None:
         """Safely parse JSON from response, returning None if not JSON."""
         if not response.content:
             return None
         try:
-            return response.json()
+            return orjson.loads(response.content)
         except (ValueError, UnicodeDecodeError):
             return None
 
@@ -226,7 +249,9 @@ class BaseClient:
         if not response.content:
             return None
 
-        return response.json()
+        # orjson parses the raw bytes noticeably faster than httpx's
+        # stdlib-backed .json(), which matters for large metadata payloads
+        return orjson.loads(response.content)
 
     def _dispatch(
         self,
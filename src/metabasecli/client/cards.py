@@ -18,6 +18,8 @@ class CardsClient:
 
     def __init__(self, client: BaseClient):
         self._client = client
+        # Memoized responses of get(); one HTTP round-trip per card per process
+        self._get_cache: dict[int, dict[str, Any]] = {}
 
     def list(
         self,
@@ -66,10 +68,17 @@ class CardsClient:
         Args:
             card_id: The ID of the card to retrieve.
 
+        The response is memoized for the lifetime of the process, so chained
+        commands (e.g. dashboard export fetching the same card twice) only
+        pay the HTTP round-trip once.
+
         Returns:
             Card dictionary with full details.
         """
-        return self._client.get(f"/card/{card_id}")
+        cached = self._get_cache.get(card_id)
+        if cached is None:
+            cached = self._get_cache[card_id] = self._client.get(f"/card/{card_id}")
+        return cached
 
     def run(
         self,
@@ -126,6 +135,7 @@ class CardsClient:
         Returns:
             Updated card dictionary.
         """
+        self._get_cache.pop(card_id, None)
         return self._client.put(f"/card/{card_id}", json=card_data)
 
     def archive(self, card_id: int) -> dict[str, Any]:
@@ -139,6 +149,7 @@ class CardsClient:
         Returns:
             Updated card dictionary.
         """
+        self._get_cache.pop(card_id, None)
         return self._client.put(f"/card/{card_id}", json={"archived": True})
 
     def delete(self, card_id: int) -> None:
@@ -149,4 +160,5 @@ class CardsClient:
         Args:
             card_id: The ID of the card to delete.
         """
+        self._get_cache.pop(card_id, None)
         self._client.delete(f"/card/{card_id}")
@@ -18,6 +18,8 @@ class CollectionsClient:
 
     def __init__(self, client: BaseClient):
         self._client = client
+        # Memoized responses of get(); one HTTP round-trip per collection per process
+        self._get_cache: dict[int | str, dict[str, Any]] = {}
 
     def get_tree(self, exclude_archived: bool = True) -> list[dict[str, Any]]:
         """Get the collection hierarchy as a tree.
@@ -52,7 +54,10 @@ class CollectionsClient:
         Returns:
             Collection dictionary with full details.
         """
-        return self._client.get(f"/collection/{collection_id}")
+        cached = self._get_cache.get(collection_id)
+        if cached is None:
+            cached = self._get_cache[collection_id] = self._client.get(f"/collection/{collection_id}")
+        return cached
 
     def list_items(
         self,
@@ -161,6 +166,7 @@ class CollectionsClient:
         if parent_id is not None:
             body["parent_id"] = parent_id
 
+        self._get_cache.pop(collection_id, None)
         return self._client.put(f"/collection/{collection_id}", json=body)
 
     def archive(self, collection_id: int) -> dict[str, Any]:
@@ -174,4 +180,5 @@ class CollectionsClient:
         Returns:
             Updated collection dictionary.
         """
+        self._get_cache.pop(collection_id, None)
         return self._client.put(f"/collection/{collection_id}", json={"archived": True})
@@ -18,6 +18,8 @@ class DashboardsClient:
 
     def __init__(self, client: BaseClient):
         self._client = client
+        # Memoized responses of get(); one HTTP round-trip per dashboard per process
+        self._get_cache: dict[int, dict[str, Any]] = {}
 
     def list(self, collection_id: int | None = None) -> list[dict[str, Any]]:
         """List dashboards with optional collection filtering.
@@ -57,7 +59,10 @@ class DashboardsClient:
         Returns:
             Dashboard dictionary with full details including dashcards.
         """
-        return self._client.get(f"/dashboard/{dashboard_id}")
+        cached = self._get_cache.get(dashboard_id)
+        if cached is None:
+            cached = self._get_cache[dashboard_id] = self._client.get(f"/dashboard/{dashboard_id}")
+        return cached
 
     def create(self, dashboard_data: dict[str, Any]) -> dict[str, Any]:
         """Create a new dashboard.
@@ -84,6 +89,7 @@ class DashboardsClient:
         Returns:
             Updated dashboard dictionary.
         """
+        self._get_cache.pop(dashboard_id, None)
         return self._client.put(f"/dashboard/{dashboard_id}", json=dashboard_data)
 
     def archive(self, dashboard_id: int) -> dict[str, Any]:
@@ -97,6 +103,7 @@ class DashboardsClient:
         Returns:
             Updated dashboard dictionary.
         """
+        self._get_cache.pop(dashboard_id, None)
         return self._client.put(f"/dashboard/{dashboard_id}", json={"archived": True})
 
     def delete(self, dashboard_id: int) -> None:
@@ -107,6 +114,7 @@ class DashboardsClient:
         Args:
             dashboard_id: The ID of the dashboard to delete.
         """
+        self._get_cache.pop(dashboard_id, None)
         self._client.delete(f"/dashboard/{dashboard_id}")
 
     def list_revisions(self, dashboard_id: int) -> list[dict[str, Any]]:
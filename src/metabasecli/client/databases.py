@@ -18,6 +18,8 @@ class DatabasesClient:
 
     def __init__(self, client: BaseClient):
         self._client = client
+        # Memoized responses of get(); keyed by (id, include_tables, include_fields)
+        self._get_cache: dict[tuple[int, bool, bool], dict[str, Any]] = {}
 
     def list(self, include_tables: bool = False) -> list[dict[str, Any]]:
         """List all databases the user has access to.
@@ -62,6 +64,11 @@ class DatabasesClient:
         Returns:
             Database dictionary.
         """
+        cache_key = (database_id, include_tables, include_fields)
+        cached = self._get_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         params: dict[str, Any] = {}
         if include_fields:
             # include_fields implies include_tables
@@ -69,7 +76,9 @@ class DatabasesClient:
         elif include_tables:
             params["include"] = "tables"
 
-        return self._client.get(f"/database/{database_id}", params=params if params else None)
+        result = self._client.get(f"/database/{database_id}", params=params if params else None)
+        self._get_cache[cache_key] = result
+        return result
 
     def get_metadata(
         self,
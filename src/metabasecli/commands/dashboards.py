@@ -4,32 +4,105 @@ Provides commands for managing Metabase dashboards including listing, viewing,
 exporting/importing, revisions, and archiving/deleting dashboards.
 """
 
-import json
+import shutil
 import sys
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Annotated, Any
 
+import orjson
 import typer
-from rich.table import Table
 
 from ..client.base import NotFoundError
 from ..constants import EXPORT_VERSION
 from ..context import get_context
 from ..logging import console, error_console
-from ..models.dashboard import Dashboard
 from ..output import (
-    create_export_dir,
+    create_export_staging_dir,
+    export_dir_target,
+    finalize_export_dir,
     get_collection_path_parts,
     handle_api_error,
     output_error_json,
     output_json,
+    utcnow_z,
     write_export_file,
     write_json_file,
 )
 
 app = typer.Typer(name="dashboards", help="Dashboard operations.")
 
+# Concurrent card creations during import
+_IMPORT_MAX_WORKERS = 6
+
+
+def _collection_name(dashboard: dict) -> str:
+    """Get a display name for a dashboard's collection from a list entry."""
+    collection = dashboard.get("collection")
+    if type(collection) is dict:
+        return collection.get("name", "")
+    collection_id = dashboard.get("collection_id")
+    return f"(ID: {collection_id})" if collection_id else ""
+
+
+# Fields that must not be sent back to the API on create/update
+_DASHBOARD_DROP_FIELDS = frozenset(
+    {
+        "id",
+        "creator_id",
+        "created_at",
+        "updated_at",
+        "made_public_by_id",
+        "public_uuid",
+        "entity_id",
+        "collection",
+        "creator",
+        "embedding_params",
+    }
+)
+_CARD_DROP_FIELDS = frozenset(
+    {
+        "id",
+        "creator",
+        "created_at",
+        "updated_at",
+        "made_public_by_id",
+        "public_uuid",
+        "entity_id",
+        "collection",
+        "creator_id",
+    }
+)
+
+
+@lru_cache(maxsize=512)
+def _load_card_file(path_str: str) -> dict[str, Any]:
+    """Load and parse a card export file, unwrapping the export envelope.
+
+    Cached so the dry-run preview and the actual import of the same file
+    within one process parse it only once.
+    """
+    data = orjson.loads(Path(path_str).read_bytes())
+    return data.get("card", data)
+
+
+def _revision_user_name(revision: dict) -> str:
+    """Get a display name for the user who made a revision."""
+    user = revision.get("user")
+    if type(user) is dict:
+        return user.get("common_name") or user.get("email", "")
+    return ""
+
+
+def _unique_card_ids(dashboard_data: dict) -> list[int]:
+    """Get unique card IDs from a raw dashboard response without building a model.
+
+    Filters out dashcards without a card_id (text cards, heading cards, etc.)
+    """
+    dashcards = dashboard_data.get("dashcards") or dashboard_data.get("ordered_cards") or []
+    return sorted({card_id for dc in dashcards if (card_id := dc.get("card_id")) is not None})
+
 
 @app.command("list")
 def list_dashboards(
@@ -80,24 +153,16 @@ def list_dashboards(
             output_json({"dashboards": dashboard_list})
         else:
             # Human-readable table output
+            from rich.table import Table
+
             table = Table(title="Dashboards")
-            table.add_column("ID", style="cyan", justify="right")
+            table.add_column("ID", style="cyan", justify="right", no_wrap=True, width=8)
             table.add_column("Name", style="green")
             table.add_column("Collection", style="magenta")
 
-            for dashboard in dashboards:
-                collection = dashboard.get("collection")
-                collection_name = ""
-                if collection and isinstance(collection, dict):
-                    collection_name = collection.get("name", "")
-                elif dashboard.get("collection_id"):
-                    collection_name = f"(ID: {dashboard.get('collection_id')})"
-
-                table.add_row(
-                    str(dashboard.get("id", "")),
-                    dashboard.get("name", ""),
-                    collection_name,
-                )
+            rows = [(str(d.get("id") or ""), d.get("name") or "", _collection_name(d)) for d in dashboards]
+            for row in rows:
+                table.add_row(*row)
 
             console.print(table)
 
@@ -122,9 +187,11 @@ def get_dashboard(
     ctx = get_context()
 
     try:
+        from ..models.dashboard import Dashboard
+
         client = ctx.require_auth()
         dashboard_data = client.dashboards.get(dashboard_id)
-        dashboard = Dashboard.from_dict(dashboard_data)
+        dashboard = Dashboard.from_dict(dashboard_data, store_raw=False)
 
         # Fetch referenced cards if requested
         referenced_cards: dict[int, dict[str, Any]] = {}
@@ -160,9 +227,8 @@ def get_dashboard(
                 }
 
             # Include dashcards
-            output_data["dashcards"] = []
-            for dc in dashboard.dashcards:
-                dc_data = {
+            output_data["dashcards"] = [
+                {
                     "id": dc.id,
                     "card_id": dc.card_id,
                     "row": dc.row,
@@ -172,7 +238,8 @@ def get_dashboard(
                     "parameter_mappings": dc.parameter_mappings,
                     "visualization_settings": dc.visualization_settings,
                 }
-                output_data["dashcards"].append(dc_data)
+                for dc in dashboard.dashcards
+            ]
 
             # Include referenced cards if fetched
             if referenced_cards:
@@ -245,111 +312,128 @@ def export_dashboard(
             console.print()
             console.print("Fetching dashboard details... ", end="")
 
-        # Fetch dashboard
+        # Fetch dashboard; raw-dict access is enough here, so skip building the model
         dashboard_data = client.dashboards.get(dashboard_id)
-        dashboard = Dashboard.from_dict(dashboard_data)
+        dashboard_name = dashboard_data.get("name", "")
 
         if not json_output:
             console.print("[green]done[/green]")
 
         # Get unique card IDs
-        card_ids = dashboard.get_unique_card_ids()
+        card_ids = _unique_card_ids(dashboard_data)
 
         if not json_output:
             console.print(f"Found {len(card_ids)} referenced cards")
 
-        # Fetch all referenced cards
-        cards: dict[int, dict[str, Any]] = {}
-        for card_id in card_ids:
-            try:
-                if not json_output:
-                    console.print(f"Exporting card {card_id}... ", end="")
-                card_data = client.cards.get(card_id)
-                cards[card_id] = card_data
-                if not json_output:
-                    console.print(f"[green]done[/green] ({card_data.get('name', 'Unknown')})")
-            except NotFoundError:
-                if not json_output:
-                    console.print("[yellow]not found (skipped)[/yellow]")
-
-        # Create export directory
-        export_dir = create_export_dir()
-
-        # Get source info
-        config = ctx.config
-        source_info = {
-            "instance_url": config.url if config else "",
-            "dashboard_id": dashboard_id,
-        }
-
-        # Write dashboard file
-        dashboard_filename = f"dashboard-{dashboard_id}.json"
-        write_export_file(
-            export_dir,
-            dashboard_filename,
-            dashboard_data,
-            "dashboard",
-            source_info,
-        )
-
-        # Write card files
-        card_files: list[dict[str, Any]] = []
-        for card_id, card_data in cards.items():
-            card_filename = f"card-{card_id}.json"
-            card_source_info = {
-                "instance_url": config.url if config else "",
-                "card_id": card_id,
-                "database_id": card_data.get("database_id"),
+        # Stage the export in a temp directory; it is renamed to the final
+        # timestamped path in one step once every file has been written.
+        export_dir = export_dir_target()
+        staging_dir = create_export_staging_dir()
+        try:
+            # Get source info
+            config = ctx.config
+            instance_url = config.url if config else ""
+            source_info = {
+                "instance_url": instance_url,
+                "dashboard_id": dashboard_id,
             }
+
+            # Write dashboard file
+            dashboard_filename = f"dashboard-{dashboard_id}.json"
             write_export_file(
-                export_dir,
-                card_filename,
-                card_data,
-                "card",
-                card_source_info,
-            )
-            card_files.append(
-                {
-                    "id": card_id,
-                    "name": card_data.get("name", ""),
-                    "file": card_filename,
-                }
+                staging_dir,
+                dashboard_filename,
+                dashboard_data,
+                "dashboard",
+                source_info,
             )
 
-        # Write manifest
-        manifest = {
-            "export_version": EXPORT_VERSION,
-            "export_timestamp": datetime.now().isoformat() + "Z",
-            "source": {
-                "instance_url": config.url if config else "",
-            },
-            "dashboard": {
-                "id": dashboard_id,
-                "name": dashboard.name,
-                "file": dashboard_filename,
-            },
-            "cards": card_files,
-        }
-        manifest_path = write_json_file(export_dir, "manifest.json", manifest)
+            # Fetch and write each referenced card in one pass, collecting
+            # (id, name, filename) triples for the manifest and output. In human
+            # mode a single progress bar replaces per-card prints, which flush
+            # the terminal twice per card.
+            card_triples: list[tuple[int, str, str]] = []
+
+            progress = None
+            task_id = None
+            if not json_output:
+                from rich.progress import Progress
+
+                progress = Progress(console=console)
+                progress.start()
+                task_id = progress.add_task("Exporting cards", total=len(card_ids))
+
+            try:
+                for card_id in card_ids:
+                    try:
+                        card_data = client.cards.get(card_id)
+                    except NotFoundError:
+                        if progress is not None:
+                            progress.console.print(f"[yellow]Card {card_id} not found (skipped)[/yellow]")
+                            progress.advance(task_id)
+                        continue
+
+                    card_filename = f"card-{card_id}.json"
+                    card_source_info = {
+                        "instance_url": instance_url,
+                        "card_id": card_id,
+                        "database_id": card_data.get("database_id"),
+                    }
+                    write_export_file(
+                        staging_dir,
+                        card_filename,
+                        card_data,
+                        "card",
+                        card_source_info,
+                    )
+                    card_name = card_data.get("name", "")
+                    card_triples.append((card_id, card_name, card_filename))
+                    if progress is not None:
+                        progress.advance(task_id)
+            finally:
+                if progress is not None:
+                    progress.stop()
+
+            # Manifest entries keep relative filenames per the documented export format
+            card_files = [{"id": i, "name": n, "file": f} for i, n, f in card_triples]
+
+            # Write manifest
+            manifest = {
+                "export_version": EXPORT_VERSION,
+                "export_timestamp": utcnow_z(),
+                "source": {
+                    "instance_url": instance_url,
+                },
+                "dashboard": {
+                    "id": dashboard_id,
+                    "name": dashboard_name,
+                    "file": dashboard_filename,
+                },
+                "cards": card_files,
+            }
+            write_json_file(staging_dir, "manifest.json", manifest)
+            export_dir = finalize_export_dir(staging_dir, export_dir)
+        finally:
+            # A failed export must not leak the hidden staging dir;
+            # on success the rename has already removed it
+            if staging_dir.is_dir():
+                shutil.rmtree(staging_dir, ignore_errors=True)
+        manifest_path = export_dir / "manifest.json"
 
         if json_output:
+            # Absolute paths built after the rename, which may have picked a
+            # suffixed directory on collision
+            card_paths = [{"id": i, "name": n, "file": str(export_dir / f)} for i, n, f in card_triples]
             output_json(
                 {
                     "output_dir": str(export_dir),
                     "manifest": str(manifest_path),
                     "dashboard": {
                         "id": dashboard_id,
-                        "name": dashboard.name,
+                        "name": dashboard_name,
                         "file": str(export_dir / dashboard_filename),
                     },
-                    "cards": [
-                        {
-                            "id": cf["id"],
-                            "name": cf["name"],
-                            "file": str(export_dir / cf["file"]),
-                        }
-                        for cf in card_files
-                    ],
+                    "cards": card_paths,
                 }
             )
         else:
@@ -360,8 +444,8 @@ def export_dashboard(
             console.print("[bold]Files created:[/bold]")
             console.print("  - manifest.json")
             console.print(f"  - {dashboard_filename}")
-            for cf in card_files:
-                console.print(f"  - {cf['file']} ({cf['name']})")
+            for _, card_name, card_filename in card_triples:
+                console.print(f"  - {card_filename} ({card_name})")
 
     except Exception as e:
         handle_api_error(e, json_output, "Dashboard")
@@ -416,13 +500,13 @@ def import_dashboard(
                     message="No input provided. Use --file or pipe JSON to stdin.",
                 )
                 raise typer.Exit(1)
-            input_json = sys.stdin.read()
+            input_bytes = sys.stdin.buffer.read()
             file_path = None
         else:
             # Read from file
             try:
                 file_path = Path(file)
-                input_json = file_path.read_text()
+                input_bytes = file_path.read_bytes()
             except FileNotFoundError:
                 output_error_json(
                     code="FILE_ERROR",
@@ -438,8 +522,8 @@ def import_dashboard(
 
         # Parse JSON
         try:
-            input_data = json.loads(input_json)
-        except json.JSONDecodeError as e:
+            input_data = orjson.loads(input_bytes)
+        except orjson.JSONDecodeError as e:
             output_error_json(
                 code="VALIDATION_ERROR",
                 message=f"Invalid JSON: {e}",
@@ -467,7 +551,7 @@ def import_dashboard(
             # Read dashboard file
             dashboard_file = manifest_dir / input_data["dashboard"]["file"]
             try:
-                dashboard_export = json.loads(dashboard_file.read_text())
+                dashboard_export = orjson.loads(dashboard_file.read_bytes())
                 dashboard_data = dashboard_export.get("dashboard", dashboard_export)
             except FileNotFoundError:
                 output_error_json(
@@ -492,20 +576,7 @@ def import_dashboard(
             dashboard_data["collection_id"] = collection_id
 
         # Remove fields that shouldn't be sent on create/update
-        fields_to_remove = [
-            "id",
-            "creator_id",
-            "created_at",
-            "updated_at",
-            "made_public_by_id",
-            "public_uuid",
-            "entity_id",
-            "collection",
-            "creator",
-            "embedding_params",
-        ]
-        for field_name in fields_to_remove:
-            dashboard_data.pop(field_name, None)
+        dashboard_data = {k: v for k, v in dashboard_data.items() if k not in _DASHBOARD_DROP_FIELDS}
 
         # Handle dry run
         if dry_run:
@@ -519,15 +590,14 @@ def import_dashboard(
             }
             for card_file in card_files_to_import:
                 try:
-                    card_export = json.loads(card_file.read_text())
-                    card_data = card_export.get("card", card_export)
+                    card_data = _load_card_file(str(card_file))
                     result["cards"].append(
                         {
                             "name": card_data.get("name"),
                             "action": "create",
                         }
                     )
-                except (FileNotFoundError, json.JSONDecodeError):
+                except (FileNotFoundError, orjson.JSONDecodeError):
                     pass
             output_json(result)
             return
@@ -537,36 +607,47 @@ def import_dashboard(
 
         # Import cards first (if not dashboard_only)
         if not dashboard_only and card_files_to_import:
+            # Prepare all payloads up front; files that fail to load are
+            # reported as failed entries without aborting the rest.
+            jobs: list[tuple[Path, dict[str, Any] | None, str | None]] = []
             for card_file in card_files_to_import:
                 try:
-                    card_export = json.loads(card_file.read_text())
-                    card_data = card_export.get("card", card_export)
-
-                    # Apply overrides
-                    if collection_id is not None:
-                        card_data["collection_id"] = collection_id
-                    if database_id is not None:
-                        if "dataset_query" in card_data:
-                            card_data["dataset_query"]["database"] = database_id
-                        card_data["database_id"] = database_id
-
-                    # Remove fields that shouldn't be sent
-                    card_fields_to_remove = [
-                        "id",
-                        "creator",
-                        "created_at",
-                        "updated_at",
-                        "made_public_by_id",
-                        "public_uuid",
-                        "entity_id",
-                        "collection",
-                        "creator_id",
-                    ]
-                    for field_name in card_fields_to_remove:
-                        card_data.pop(field_name, None)
-
-                    # Create card
-                    created_card = client.cards.create(card_data)
+                    card_data = dict(_load_card_file(str(card_file)))
+                except (FileNotFoundError, orjson.JSONDecodeError) as e:
+                    jobs.append((card_file, None, str(e)))
+                    continue
+
+                # Apply overrides; the dict() above is a shallow copy of the
+                # cached payload, so nested dicts are replaced, not mutated
+                if collection_id is not None:
+                    card_data["collection_id"] = collection_id
+                if database_id is not None:
+                    if "dataset_query" in card_data:
+                        card_data["dataset_query"] = {**card_data["dataset_query"], "database": database_id}
+                    card_data["database_id"] = database_id
+
+                # Remove fields that shouldn't be sent
+                card_data = {k: v for k, v in card_data.items() if k not in _CARD_DROP_FIELDS}
+                jobs.append((card_file, card_data, None))
+
+            # Create cards concurrently; the worker cap keeps us within the
+            # concurrency the Metabase server is typically tuned for.
+            with ThreadPoolExecutor(max_workers=_IMPORT_MAX_WORKERS) as executor:
+                futures = [
+                    executor.submit(client.cards.create, card_data) if card_data is not None else None
+                    for _, card_data, _ in jobs
+                ]
+                for (card_file, _, error), future in zip(jobs, futures, strict=True):
+                    if future is None:
+                        imported_cards.append(
+                            {
+                                "file": str(card_file),
+                                "action": "failed",
+                                "error": error,
+                            }
+                        )
+                        continue
+                    created_card = future.result()
                     imported_cards.append(
                         {
                             "id": created_card.get("id"),
@@ -574,14 +655,6 @@ def import_dashboard(
                             "action": "created",
                         }
                     )
-                except (FileNotFoundError, json.JSONDecodeError) as e:
-                    imported_cards.append(
-                        {
-                            "file": str(card_file),
-                            "action": "failed",
-                            "error": str(e),
-                        }
-                    )
 
         # Import dashboard (if not cards_only)
         dashboard_result: dict[str, Any] | None = None
@@ -737,24 +810,25 @@ def list_revisions(
             if not revisions:
                 console.print("[dim]No revisions found.[/dim]")
             else:
+                from rich.table import Table
+
                 table = Table()
-                table.add_column("Revision ID", style="cyan", justify="right")
+                table.add_column("Revision ID", style="cyan", justify="right", no_wrap=True, width=11)
                 table.add_column("User", style="green")
                 table.add_column("Description", style="white")
-                table.add_column("Timestamp", style="dim")
-
-                for rev in revisions:
-                    user = rev.get("user", {})
-                    user_name = ""
-                    if isinstance(user, dict):
-                        user_name = user.get("common_name") or user.get("email", "")
-
-                    table.add_row(
-                        str(rev.get("id", "")),
-                        user_name,
-                        rev.get("description", ""),
-                        rev.get("timestamp", ""),
+                table.add_column("Timestamp", style="dim", no_wrap=True)
+
+                rows = [
+                    (
+                        str(rev.get("id") or ""),
+                        _revision_user_name(rev),
+                        rev.get("description") or "",
+                        rev.get("timestamp") or "",
                     )
+                    for rev in revisions
+                ]
+                for row in rows:
+                    table.add_row(*row)
 
                 console.print(table)
 
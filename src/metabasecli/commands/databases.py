@@ -4,25 +4,38 @@ Provides commands for listing databases, viewing database details,
 metadata, and schemas.
 """
 
+from collections import defaultdict
 from typing import Annotated
 
 import typer
-from rich.table import Table
-from rich.tree import Tree
 
 from ..context import get_context
 from ..logging import console
-from ..output import handle_api_error, output_json
+from ..output import handle_api_error, output_json, utcnow_z
 
 app = typer.Typer(name="databases", help="Database operations.")
 
 
+def _tables_cell(db: dict) -> str:
+    """Format the Tables column for a database list row."""
+    tables = db.get("tables", [])
+    return str(len(tables)) if isinstance(tables, list) else str(tables)
+
+
 @app.command("list")
 def list_databases(
     include_tables: Annotated[
         bool,
         typer.Option("--include-tables", help="Include table information."),
     ] = False,
+    limit: Annotated[
+        int,
+        typer.Option("--limit", help="Show at most this many databases (0 = all)."),
+    ] = 0,
+    offset: Annotated[
+        int,
+        typer.Option("--offset", help="Skip this many databases."),
+    ] = 0,
     json_output: Annotated[
         bool,
         typer.Option("--json", help="Output as JSON."),
@@ -35,6 +48,13 @@ def list_databases(
         client = ctx.require_auth()
         databases = client.databases.list(include_tables=include_tables)
 
+        # The database API has no server-side pagination, so trim the page
+        # before formatting to avoid rendering entries the user skipped
+        if offset:
+            databases = databases[offset:]
+        if limit:
+            databases = databases[:limit]
+
         if json_output:
             # Build output data
             db_list = []
@@ -55,6 +75,8 @@ def list_databases(
             output_json({"databases": db_list})
         else:
             # Human-readable table output
+            from rich.table import Table
+
             table = Table(title="Databases")
             table.add_column("ID", style="cyan", justify="right")
             table.add_column("Name", style="green")
@@ -62,18 +84,14 @@ def list_databases(
             if include_tables:
                 table.add_column("Tables", justify="right")
 
-            for db in databases:
-                row = [
-                    str(db.get("id", "")),
-                    db.get("name", ""),
-                    db.get("engine", ""),
+            if include_tables:
+                rows = [
+                    (str(db.get("id", "")), db.get("name", ""), db.get("engine", ""), _tables_cell(db))
+                    for db in databases
                 ]
-                if include_tables:
-                    tables = db.get("tables", [])
-                    if isinstance(tables, list):
-                        row.append(str(len(tables)))
-                    else:
-                        row.append(str(tables))
+            else:
+                rows = [(str(db.get("id", "")), db.get("name", ""), db.get("engine", "")) for db in databases]
+            for row in rows:
                 table.add_row(*row)
 
             console.print(table)
@@ -149,6 +167,68 @@ def get_database(
         raise typer.Exit(1) from None
 
 
+# Above this many tables, --json metadata is streamed instead of buffered
+_STREAM_TABLE_THRESHOLD = 500
+
+
+def _stream_metadata_json(metadata: dict) -> None:
+    """Write the metadata --json envelope incrementally to stdout.
+
+    Serializes one table at a time instead of materializing the whole
+    envelope string, so peak memory stays flat for databases with tens of
+    thousands of fields. Output is compact (not pretty-printed) but has the
+    same {"success", "data", "meta"} shape as output_json.
+    """
+    import sys
+
+    import orjson
+
+    tables = metadata.get("tables", [])
+    head = {k: v for k, v in metadata.items() if k != "tables"}
+
+    meta: dict = {"timestamp": utcnow_z()}
+    api_calls = get_context().api_call_count
+    if api_calls > 0:
+        meta["api_calls"] = api_calls
+
+    write = sys.stdout.write
+    write('{"success":true,"data":')
+    # Open the data object from the non-table fields, then splice the
+    # tables array in before its closing brace
+    head_json = orjson.dumps(head, default=str).decode()
+    write(head_json[:-1] + ',"tables":[' if len(head_json) > 2 else '{"tables":[')
+    for i, t in enumerate(tables):
+        if i:
+            write(",")
+        write(orjson.dumps(t, default=str).decode())
+    write(']},"meta":' + orjson.dumps(meta, default=str).decode() + "}\n")
+
+
+# Stripped forms of Metabase type names; fields share a handful of types
+# ("type/Text", "type/Integer", ...) so the cache converts per-field string
+# scans into dict hits
+_TYPE_CACHE: dict[str, str] = {}
+
+
+def _strip_type(type_name: str) -> str:
+    """Strip the "type/" prefix from a Metabase type name, with caching."""
+    short = _TYPE_CACHE.get(type_name)
+    if short is None:
+        short = _TYPE_CACHE[type_name] = type_name.removeprefix("type/")
+    return short
+
+
+def _format_field(f: dict) -> str:
+    """Format a field line with its simplified base and semantic types."""
+    field_name = f.get("display_name") or f.get("name", "Unknown")
+    base_type = f.get("base_type", "")
+    short_type = _strip_type(base_type) if base_type else ""
+    semantic = f.get("semantic_type")
+    if semantic:
+        return f"{field_name} [dim]{short_type}[/dim] [blue]({_strip_type(semantic)})[/blue]"
+    return f"{field_name} [dim]{short_type}[/dim]"
+
+
 @app.command("metadata")
 def get_metadata(
     database_id: Annotated[int, typer.Argument(help="Database ID.")],
@@ -156,6 +236,14 @@ def get_metadata(
         bool,
         typer.Option("--include-hidden", help="Include hidden tables and fields."),
     ] = False,
+    schema: Annotated[
+        str | None,
+        typer.Option("--schema", help="Only show tables in this schema."),
+    ] = None,
+    tree_output: Annotated[
+        bool,
+        typer.Option("--tree", help="Render as a tree with guide lines instead of streaming."),
+    ] = False,
     json_output: Annotated[
         bool,
         typer.Option("--json", help="Output as JSON."),
@@ -168,8 +256,18 @@ def get_metadata(
         client = ctx.require_auth()
         metadata = client.databases.get_metadata(database_id, include_hidden=include_hidden)
 
+        # Filter to one schema before grouping/serializing anything
+        if schema is not None:
+            metadata = {
+                **metadata,
+                "tables": [t for t in metadata.get("tables", []) if (t.get("schema") or "(no schema)") == schema],
+            }
+
         if json_output:
-            output_json(metadata)
+            if len(metadata.get("tables", [])) > _STREAM_TABLE_THRESHOLD:
+                _stream_metadata_json(metadata)
+            else:
+                output_json(metadata)
         else:
             # Human-readable tree output
             db_name = metadata.get("name", "Unknown Database")
@@ -184,39 +282,46 @@ def get_metadata(
                 console.print("[dim]No tables found[/dim]")
                 return
 
-            # Group tables by schema
-            schemas: dict[str, list] = {}
+            # Group tables by schema, decorated with the sort key so the
+            # per-schema sort compares pre-extracted names instead of
+            # calling .get() for every comparison
+            schemas: dict[str, list] = defaultdict(list)
             for t in tables:
-                schema_name = t.get("schema") or "(no schema)"
-                if schema_name not in schemas:
-                    schemas[schema_name] = []
-                schemas[schema_name].append(t)
+                schemas[t.get("schema") or "(no schema)"].append((t.get("name", ""), t))
 
-            # Create tree
-            tree = Tree(f"[bold]{db_name}[/bold]")
+            if tree_output:
+                # Materialize the full tree with guide lines
+                from rich.tree import Tree
 
-            for schema_name in sorted(schemas.keys()):
-                schema_tables = schemas[schema_name]
-                schema_branch = tree.add(f"[cyan]{schema_name}[/cyan]")
+                tree = Tree(f"[bold]{db_name}[/bold]")
 
-                for t in sorted(schema_tables, key=lambda x: x.get("name", "")):
-                    table_name = t.get("display_name") or t.get("name", "Unknown")
-                    table_branch = schema_branch.add(f"[green]{table_name}[/green]")
+                for schema_name in sorted(schemas):
+                    schema_tables = schemas[schema_name]
+                    schema_branch = tree.add(f"[cyan]{schema_name}[/cyan]")
 
-                    fields = t.get("fields", [])
-                    for f in fields:
-                        field_name = f.get("display_name") or f.get("name", "Unknown")
-                        base_type = f.get("base_type", "")
-                        # Simplify the type for display
-                        short_type = base_type.replace("type/", "") if base_type else ""
-                        semantic = f.get("semantic_type")
-                        if semantic:
-                            semantic = semantic.replace("type/", "")
-                            table_branch.add(f"{field_name} [dim]{short_type}[/dim] [blue]({semantic})[/blue]")
-                        else:
-                            table_branch.add(f"{field_name} [dim]{short_type}[/dim]")
-
-            console.print(tree)
+                    schema_tables.sort(key=lambda pair: pair[0])
+                    for _, t in schema_tables:
+                        table_name = t.get("display_name") or t.get("name", "Unknown")
+                        table_branch = schema_branch.add(f"[green]{table_name}[/green]")
+
+                        for f in t.get("fields", []):
+                            table_branch.add(_format_field(f))
+
+                console.print(tree)
+            else:
+                # Stream schema by schema so output starts immediately and no
+                # tree is materialized for databases with thousands of fields
+                for schema_name in sorted(schemas):
+                    schema_tables = schemas[schema_name]
+                    console.print(f"[cyan]{schema_name}[/cyan]")
+
+                    schema_tables.sort(key=lambda pair: pair[0])
+                    for _, t in schema_tables:
+                        table_name = t.get("display_name") or t.get("name", "Unknown")
+                        console.print(f"  [green]{table_name}[/green]")
+
+                        for f in t.get("fields", []):
+                            console.print(f"    {_format_field(f)}")
 
     except Exception as e:
         handle_api_error(e, json_output, "Database")
@@ -4,13 +4,15 @@ Parses Metabase URLs and retrieves information about the referenced entity,
 supporting questions, dashboards, collections, and databases.
 """
 
-import re
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING, Annotated, Any
-from urllib.parse import urlparse
 
 import typer
-from rich.table import Table
+from rich.text import Text
 
+from ..client.base import MetabaseAPIError
 from ..context import get_context
 from ..logging import console, error_console
 from ..output import get_collection_path_parts, handle_api_error, output_error_json, output_json
@@ -18,19 +20,33 @@ from ..output import get_collection_path_parts, handle_api_error, output_error_j
 if TYPE_CHECKING:
     from ..client import MetabaseClient
 
-# Entity type mappings from URL path to API entity type
+# Pre-styled Text fragments for human output; Rich reparses markup strings
+# on every print, plain Text objects skip that entirely
+_URL_LABEL = Text("URL:", style="bold")
+_NA = Text("N/A", style="dim")
+
+# Entity type mappings from URL path to API entity type. Interned so the
+# dict probes and downstream entity_type comparisons hit pointer equality
+# (identifier-like literals are interned anyway; "browse/databases" is not).
 URL_PATH_PATTERNS = {
-    "question": "card",
-    "dashboard": "dashboard",
-    "collection": "collection",
-    "browse/databases": "database",
-    "browse": "database",  # /browse/1/schema/public pattern
+    sys.intern(path): sys.intern(entity_type)
+    for path, entity_type in {
+        "question": "card",
+        "dashboard": "dashboard",
+        "collection": "collection",
+        "browse/databases": "database",
+        "browse": "database",  # /browse/1/schema/public pattern
+    }.items()
 }
 
 
+@lru_cache(maxsize=256)
 def parse_metabase_url(url: str) -> tuple[str, int, dict | None] | None:
     """Parse Metabase URL and return (entity_type, entity_id, extra_info) or None.
 
+    Pure function of the URL string, so results are memoized; batch callers
+    resolving repeated URLs skip the parse entirely.
+
     Handles both full URLs and paths. Extracts ID from patterns like `123` or `123-slug-text`.
 
     Args:
@@ -41,58 +57,68 @@ def parse_metabase_url(url: str) -> tuple[str, int, dict | None] | None:
         entity_type is one of: card, dashboard, collection, database
         extra_info may contain additional parsed information like schema name
     """
-    # Parse the URL to get the path
-    if url.startswith("/"):
-        # It's already a path
-        path = url
-    else:
-        # It's a full URL
-        parsed = urlparse(url)
-        path = parsed.path
-
-    # Remove leading slash and split
-    path = path.lstrip("/")
-    parts = path.split("/")
-
-    if not parts:
-        return None
+    # Slicing beats a startswith method call here, and "" slices to ""
+    path = url if url[:1] == "/" else _extract_path(url)
 
-    # Handle /browse/databases/1 pattern
-    if len(parts) >= 3 and parts[0] == "browse" and parts[1] == "databases":
-        id_part = parts[2]
-        entity_id = _extract_id(id_part)
-        if entity_id is not None:
-            return ("database", entity_id, None)
+    # Remove leading slash and tokenize; only the first few components matter
+    parts = path.strip("/").split("/", 4)
+
+    handler = _PARSERS.get(parts[0])
+    return handler(parts) if handler else None
 
-    # Handle /browse/1/schema/public pattern (database schema)
-    if len(parts) >= 4 and parts[0] == "browse" and parts[2] == "schema":
-        id_part = parts[1]
-        entity_id = _extract_id(id_part)
-        schema_name = parts[3] if len(parts) > 3 else None
-        if entity_id is not None:
-            return ("database", entity_id, {"schema": schema_name})
-
-    # Handle /browse/1 pattern (just database ID without /databases/)
-    if len(parts) >= 2 and parts[0] == "browse":
-        id_part = parts[1]
-        entity_id = _extract_id(id_part)
-        if entity_id is not None:
-            return ("database", entity_id, None)
 
-    # Handle standard patterns: /question/123, /dashboard/456, /collection/789
-    if len(parts) >= 2:
-        entity_path = parts[0]
-        id_part = parts[1]
+def _parse_browse(parts: list[str]) -> tuple[str, int, dict | None] | None:
+    """Parse /browse/... paths.
+
+    Handles /browse/databases/<id>, /browse/<id>/schema/<schema> and the
+    bare /browse/<id> form.
+    """
+    if len(parts) < 2:
+        return None
+    if parts[1] == "databases":
+        if len(parts) >= 3 and (entity_id := _extract_id(parts[2])) is not None:
+            return ("database", entity_id, None)
+        return None
+    entity_id = _extract_id(parts[1])
+    if entity_id is None:
+        return None
+    if len(parts) >= 4 and parts[2] == "schema":
+        return ("database", entity_id, {"schema": parts[3]})
+    return ("database", entity_id, None)
 
-        entity_type = URL_PATH_PATTERNS.get(entity_path)
-        if entity_type:
-            entity_id = _extract_id(id_part)
-            if entity_id is not None:
-                return (entity_type, entity_id, None)
 
+def _parse_standard(parts: list[str]) -> tuple[str, int, dict | None] | None:
+    """Parse the standard /question|dashboard|collection/<id> paths."""
+    if len(parts) >= 2 and (entity_id := _extract_id(parts[1])) is not None:
+        return (URL_PATH_PATTERNS[parts[0]], entity_id, None)
     return None
 
 
+# First path component -> parser; one dict lookup replaces the old
+# cascade of per-pattern length and equality checks
+_PARSERS = {
+    "browse": _parse_browse,
+    "question": _parse_standard,
+    "dashboard": _parse_standard,
+    "collection": _parse_standard,
+}
+
+
+def _extract_path(url: str) -> str:
+    """Get the path component from a URL that does not start with "/".
+
+    Only pays for urlparse when there is actually a scheme to strip; bare
+    paths take a cheap partition to drop any query string or fragment. The
+    scheme scan is bounded to the first 16 characters — longer than any URL
+    scheme we care about — so long path-only inputs are not scanned fully.
+    """
+    if url.find("://", 0, 16) != -1:
+        from urllib.parse import urlparse
+
+        return urlparse(url).path
+    return url.partition("?")[0].partition("#")[0]
+
+
 def _extract_id(id_part: str) -> int | None:
     """Extract numeric ID from a URL path part like '123' or '123-slug-text'.
 
@@ -102,170 +128,235 @@ def _extract_id(id_part: str) -> int | None:
     Returns:
         The numeric ID or None if no valid ID found
     """
-    # Match numeric ID, optionally followed by a slug
-    match = re.match(r"^(\d+)(?:-.*)?$", id_part)
-    if match:
-        return int(match.group(1))
+    # Fast path: plain numeric ID without a slug. isdecimal, not isdigit:
+    # isdigit also accepts characters like superscripts that int() rejects
+    if id_part.isdecimal():
+        return int(id_part)
+
+    # Otherwise accept only digits followed by a "-slug" suffix; a manual
+    # scan of the leading digits is cheaper than the regex engine here
+    i = 0
+    n = len(id_part)
+    while i < n and id_part[i].isdecimal():
+        i += 1
+    if i and id_part[i] == "-":
+        return int(id_part[:i])
     return None
 
 
-def _fetch_card(client: "MetabaseClient", card_id: int) -> dict[str, Any]:
+@dataclass(slots=True)
+class ResolvedEntity:
+    """A resolved Metabase entity ready for output."""
+
+    entity_type: str
+    entity_id: int
+    entity: dict[str, Any]
+    collection_path_str: str | None = None
+    raw: dict[str, Any] | None = None
+
+
+def _collection_out(collection: dict | None, collection_path: list[str]) -> dict[str, Any] | None:
+    """Build the nested collection dict shared by card and dashboard output."""
+    if not collection:
+        return None
+    return {
+        "id": collection.get("id"),
+        "name": collection.get("name"),
+        "path": collection_path,
+    }
+
+
+def _hydrate_collection(client: "MetabaseClient", collection: dict | None) -> dict | None:
+    """Fetch the full collection when the embedded one lacks ancestry.
+
+    Some endpoints embed the collection without effective_ancestors, which
+    truncates the printed path to the immediate parent. The collections
+    client is memoized per process, so this costs at most one extra request
+    per distinct collection. Falls back to the embedded dict on API errors.
+    """
+    if not collection or "effective_ancestors" in collection or not collection.get("id"):
+        return collection
+    try:
+        return client.collections.get(collection["id"])
+    except MetabaseAPIError:
+        return collection
+
+
+def _fetch_card(client: "MetabaseClient", card_id: int, include_raw: bool = True) -> ResolvedEntity:
     """Fetch card and format for output.
 
     Args:
         client: The Metabase API client.
         card_id: The ID of the card to fetch.
+        include_raw: If False, skip attaching the raw API response.
 
     Returns:
-        A dictionary containing entity_type, entity_id, entity details, and raw data.
+        The resolved card.
     """
     card = client.cards.get(card_id)
+    get = card.get
 
     # Get collection info
-    collection = card.get("collection")
+    collection = _hydrate_collection(client, get("collection"))
     collection_path_str, collection_path = get_collection_path_parts(collection or {})
+    database = get("database")
+    dataset_query = get("dataset_query")
 
-    return {
-        "entity_type": "card",
-        "entity_id": card_id,
-        "entity": {
+    return ResolvedEntity(
+        entity_type="card",
+        entity_id=card_id,
+        entity={
             "id": card_id,
-            "name": card.get("name"),
-            "description": card.get("description"),
-            "collection_id": card.get("collection_id"),
-            "collection": {
-                "id": collection.get("id") if collection else None,
-                "name": collection.get("name") if collection else "Root Collection",
-                "path": collection_path,
-            }
-            if collection
-            else None,
-            "database_id": card.get("database_id"),
-            "database_name": card.get("database", {}).get("name") if card.get("database") else None,
-            "display": card.get("display"),
-            "query_type": card.get("dataset_query", {}).get("type"),
-            "created_at": card.get("created_at"),
-            "updated_at": card.get("updated_at"),
+            "name": get("name"),
+            "description": get("description"),
+            "collection_id": get("collection_id"),
+            "collection": _collection_out(collection, collection_path),
+            "database_id": get("database_id"),
+            "database_name": database.get("name") if database else None,
+            "display": get("display"),
+            "query_type": dataset_query.get("type") if dataset_query else None,
+            "created_at": get("created_at"),
+            "updated_at": get("updated_at"),
         },
-        "_raw": card,
-        "_collection_path_str": collection_path_str,
-    }
+        collection_path_str=collection_path_str,
+        raw=card if include_raw else None,
+    )
 
 
-def _fetch_dashboard(client: "MetabaseClient", dashboard_id: int) -> dict[str, Any]:
+def _fetch_dashboard(client: "MetabaseClient", dashboard_id: int, include_raw: bool = True) -> ResolvedEntity:
     """Fetch dashboard and format for output.
 
     Args:
         client: The Metabase API client.
         dashboard_id: The ID of the dashboard to fetch.
+        include_raw: If False, skip attaching the raw API response.
 
     Returns:
-        A dictionary containing entity_type, entity_id, entity details, and raw data.
+        The resolved dashboard.
     """
     dashboard = client.dashboards.get(dashboard_id)
+    get = dashboard.get
 
     # Get collection info
-    collection = dashboard.get("collection")
+    collection = _hydrate_collection(client, get("collection"))
     collection_path_str, collection_path = get_collection_path_parts(collection or {})
 
-    # Count dashcards
-    dashcards = dashboard.get("dashcards", dashboard.get("ordered_cards", []))
-    dashcard_count = len(dashcards) if dashcards else 0
+    # Count dashcards (older Metabase versions use "ordered_cards")
+    dashcards = get("dashcards") or get("ordered_cards") or []
+    dashcard_count = len(dashcards)
 
-    return {
-        "entity_type": "dashboard",
-        "entity_id": dashboard_id,
-        "entity": {
+    return ResolvedEntity(
+        entity_type="dashboard",
+        entity_id=dashboard_id,
+        entity={
             "id": dashboard_id,
-            "name": dashboard.get("name"),
-            "description": dashboard.get("description"),
-            "collection_id": dashboard.get("collection_id"),
-            "collection": {
-                "id": collection.get("id") if collection else None,
-                "name": collection.get("name") if collection else "Root Collection",
-                "path": collection_path,
-            }
-            if collection
-            else None,
+            "name": get("name"),
+            "description": get("description"),
+            "collection_id": get("collection_id"),
+            "collection": _collection_out(collection, collection_path),
             "dashcard_count": dashcard_count,
-            "parameters": dashboard.get("parameters", []),
-            "created_at": dashboard.get("created_at"),
-            "updated_at": dashboard.get("updated_at"),
+            "parameters": get("parameters", []),
+            "created_at": get("created_at"),
+            "updated_at": get("updated_at"),
         },
-        "_raw": dashboard,
-        "_collection_path_str": collection_path_str,
-    }
+        collection_path_str=collection_path_str,
+        raw=dashboard if include_raw else None,
+    )
 
 
-def _fetch_collection(client: "MetabaseClient", collection_id: int) -> dict[str, Any]:
+def _fetch_collection(client: "MetabaseClient", collection_id: int, include_raw: bool = True) -> ResolvedEntity:
     """Fetch collection and format for output.
 
     Args:
         client: The Metabase API client.
         collection_id: The ID of the collection to fetch.
+        include_raw: If False, skip attaching the raw API response.
 
     Returns:
-        A dictionary containing entity_type, entity_id, entity details, and raw data.
+        The resolved collection.
     """
     collection = client.collections.get(collection_id)
+    get = collection.get
 
     # Get parent collection path
-    parent = collection.get("parent_id")
-    ancestors = collection.get("effective_ancestors", [])
-    path_parts = [a.get("name", "") for a in ancestors if a.get("name")]
-    path_parts.append(collection.get("name", ""))
+    name = get("name", "")
+    ancestors = get("effective_ancestors", [])
+    path_parts = [ancestor_name for a in ancestors if (ancestor_name := a.get("name"))]
+    path_parts.append(name)
     collection_path_str = "/" + "/".join(path_parts) if path_parts else "/"
 
-    return {
-        "entity_type": "collection",
-        "entity_id": collection_id,
-        "entity": {
+    return ResolvedEntity(
+        entity_type="collection",
+        entity_id=collection_id,
+        entity={
             "id": collection_id,
-            "name": collection.get("name"),
-            "description": collection.get("description"),
-            "parent_id": parent,
+            "name": name,
+            "description": get("description"),
+            "parent_id": get("parent_id"),
             "path": path_parts,
-            "archived": collection.get("archived", False),
-            "personal_owner_id": collection.get("personal_owner_id"),
+            "archived": get("archived", False),
+            "personal_owner_id": get("personal_owner_id"),
         },
-        "_raw": collection,
-        "_collection_path_str": collection_path_str,
-    }
+        collection_path_str=collection_path_str,
+        raw=collection if include_raw else None,
+    )
 
 
-def _fetch_database(client: "MetabaseClient", database_id: int, schema_name: str | None = None) -> dict[str, Any]:
+def _fetch_database(
+    client: "MetabaseClient",
+    database_id: int,
+    schema_name: str | None = None,
+    include_raw: bool = True,
+) -> ResolvedEntity:
     """Fetch database and format for output.
 
     Args:
         client: The Metabase API client.
         database_id: The ID of the database to fetch.
         schema_name: Optional schema name if URL included a schema path.
+        include_raw: If False, skip attaching the raw API response.
 
     Returns:
-        A dictionary containing entity_type, entity_id, entity details, and raw data.
+        The resolved database.
     """
     database = client.databases.get(database_id)
-
-    result = {
-        "entity_type": "database",
-        "entity_id": database_id,
-        "entity": {
-            "id": database_id,
-            "name": database.get("name"),
-            "description": database.get("description"),
-            "engine": database.get("engine"),
-            "created_at": database.get("created_at"),
-            "updated_at": database.get("updated_at"),
-        },
-        "_raw": database,
-        "_collection_path_str": None,
+    get = database.get
+
+    entity = {
+        "id": database_id,
+        "name": get("name"),
+        "description": get("description"),
+        "engine": get("engine"),
+        "created_at": get("created_at"),
+        "updated_at": get("updated_at"),
     }
 
     # If a schema was specified, add it to the output
     if schema_name:
-        result["entity"]["schema"] = schema_name
+        entity["schema"] = schema_name
+
+    return ResolvedEntity(
+        entity_type="database",
+        entity_id=database_id,
+        entity=entity,
+        raw=database if include_raw else None,
+    )
+
+
+def _fetch_database_from_url(
+    client: "MetabaseClient", database_id: int, extra_info: dict | None, include_raw: bool = True
+) -> ResolvedEntity:
+    """Adapter that pulls the schema name out of parsed URL extras."""
+    return _fetch_database(client, database_id, extra_info.get("schema") if extra_info else None, include_raw)
 
-    return result
+
+# Entity type -> fetcher, each taking (client, entity_id, extra_info, include_raw)
+_FETCHERS = {
+    "card": lambda client, entity_id, extra_info, include_raw: _fetch_card(client, entity_id, include_raw),
+    "dashboard": lambda client, entity_id, extra_info, include_raw: _fetch_dashboard(client, entity_id, include_raw),
+    "collection": lambda client, entity_id, extra_info, include_raw: _fetch_collection(client, entity_id, include_raw),
+    "database": _fetch_database_from_url,
+}
 
 
 def resolve_command(
@@ -293,13 +384,15 @@ def resolve_command(
                 details={"url": url},
             )
         else:
-            error_console.print(f"[red]Could not parse URL: {url}[/red]")
-            error_console.print("[dim]Supported patterns:[/dim]")
-            error_console.print("  /question/<id>")
-            error_console.print("  /dashboard/<id>")
-            error_console.print("  /collection/<id>")
-            error_console.print("  /browse/databases/<id>")
-            error_console.print("  /browse/<id>/schema/<schema>")
+            error_console.print(
+                f"[red]Could not parse URL: {url}[/red]\n"
+                "[dim]Supported patterns:[/dim]\n"
+                "  /question/<id>\n"
+                "  /dashboard/<id>\n"
+                "  /collection/<id>\n"
+                "  /browse/databases/<id>\n"
+                "  /browse/<id>/schema/<schema>"
+            )
         raise typer.Exit(1)
 
     entity_type, entity_id, extra_info = parsed
@@ -310,16 +403,8 @@ def resolve_command(
         client = ctx.require_auth()
 
         # Fetch entity based on type
-        if entity_type == "card":
-            result = _fetch_card(client, entity_id)
-        elif entity_type == "dashboard":
-            result = _fetch_dashboard(client, entity_id)
-        elif entity_type == "collection":
-            result = _fetch_collection(client, entity_id)
-        elif entity_type == "database":
-            schema_name = extra_info.get("schema") if extra_info else None
-            result = _fetch_database(client, entity_id, schema_name)
-        else:
+        fetcher = _FETCHERS.get(entity_type)
+        if fetcher is None:
             if json_output:
                 output_error_json(
                     code="UNSUPPORTED_TYPE",
@@ -329,14 +414,17 @@ def resolve_command(
                 error_console.print(f"[red]Unsupported entity type: {entity_type}[/red]")
             raise typer.Exit(1)
 
+        # The --json branch never emits the raw payload, so skip carrying it
+        result = fetcher(client, entity_id, extra_info, not json_output)
+
         # Output the result
         if json_output:
-            # Build the JSON output, excluding internal keys
+            # Build the JSON output, excluding internal fields
             output_data = {
                 "url": url,
-                "entity_type": result["entity_type"],
-                "entity_id": result["entity_id"],
-                "entity": result["entity"],
+                "entity_type": result.entity_type,
+                "entity_id": result.entity_id,
+                "entity": result.entity,
             }
             output_json(output_data)
         else:
@@ -347,75 +435,82 @@ def resolve_command(
         raise typer.Exit(1) from None
 
 
-def _print_human_output(url: str, result: dict[str, Any]) -> None:
+def _print_human_output(url: str, result: ResolvedEntity) -> None:
     """Print human-readable output for the resolved entity.
 
     Args:
         url: The original URL that was resolved.
-        result: The fetch result dictionary containing entity information.
+        result: The resolved entity to print.
     """
-    entity = result["entity"]
-    entity_type = result["entity_type"]
+    entity = result.entity
+    entity_type = result.entity_type
+    eget = entity.get
 
-    console.print(f"\n[bold]URL:[/bold] {url}")
+    console.print()
+    console.print(_URL_LABEL, url)
     console.print()
 
-    table = Table(show_header=False, box=None, padding=(0, 2))
-    table.add_column("Field", style="bold cyan")
-    table.add_column("Value")
-
-    table.add_row("Entity Type", entity_type)
-    table.add_row("Entity ID", str(result["entity_id"]))
-    table.add_row("Name", entity.get("name") or "[dim]N/A[/dim]")
+    # Collect the rows first, then emit them in one sweep
+    rows: list[tuple[str, Any]] = [
+        ("Entity Type", entity_type),
+        ("Entity ID", str(result.entity_id)),
+        ("Name", eget("name") or _NA),
+    ]
 
-    if entity.get("description"):
-        table.add_row("Description", entity["description"])
+    if description := eget("description"):
+        rows.append(("Description", description))
 
     # Collection path (for cards, dashboards, collections)
-    collection_path = result.get("_collection_path_str")
-    if collection_path:
-        table.add_row("Collection", collection_path)
+    if collection_path := result.collection_path_str:
+        rows.append(("Collection", collection_path))
 
     # Type-specific fields
     if entity_type == "card":
-        if entity.get("database_name"):
-            table.add_row("Database", f"{entity['database_name']} (id: {entity.get('database_id')})")
-        elif entity.get("database_id"):
-            table.add_row("Database ID", str(entity["database_id"]))
+        if database_name := eget("database_name"):
+            rows.append(("Database", f"{database_name} (id: {eget('database_id')})"))
+        elif database_id := eget("database_id"):
+            rows.append(("Database ID", str(database_id)))
 
-        if entity.get("display"):
-            table.add_row("Display", entity["display"])
+        if display := eget("display"):
+            rows.append(("Display", display))
 
-        if entity.get("query_type"):
-            table.add_row("Query Type", entity["query_type"])
+        if query_type := eget("query_type"):
+            rows.append(("Query Type", query_type))
 
     elif entity_type == "dashboard":
-        if entity.get("dashcard_count") is not None:
-            table.add_row("Cards", str(entity["dashcard_count"]))
+        if (dashcard_count := eget("dashcard_count")) is not None:
+            rows.append(("Cards", str(dashcard_count)))
 
-        if entity.get("parameters"):
-            param_names = [p.get("name", p.get("slug", "?")) for p in entity["parameters"]]
-            table.add_row("Parameters", ", ".join(param_names) if param_names else "[dim]None[/dim]")
+        if parameters := eget("parameters"):
+            rows.append(("Parameters", ", ".join(p.get("name") or p.get("slug") or "?" for p in parameters)))
 
     elif entity_type == "collection":
-        if entity.get("parent_id"):
-            table.add_row("Parent ID", str(entity["parent_id"]))
+        if parent_id := eget("parent_id"):
+            rows.append(("Parent ID", str(parent_id)))
 
-        if entity.get("archived"):
-            table.add_row("Archived", "Yes")
+        if eget("archived"):
+            rows.append(("Archived", "Yes"))
 
     elif entity_type == "database":
-        if entity.get("engine"):
-            table.add_row("Engine", entity["engine"])
+        if engine := eget("engine"):
+            rows.append(("Engine", engine))
 
-        if entity.get("schema"):
-            table.add_row("Schema", entity["schema"])
+        if schema := eget("schema"):
+            rows.append(("Schema", schema))
 
     # Timestamps
-    if entity.get("updated_at"):
-        table.add_row("Last Updated", entity["updated_at"])
-    elif entity.get("created_at"):
-        table.add_row("Created", entity["created_at"])
+    if updated_at := eget("updated_at"):
+        rows.append(("Last Updated", updated_at))
+    elif created_at := eget("created_at"):
+        rows.append(("Created", created_at))
+
+    from rich.table import Table
+
+    table = Table(show_header=False, box=None, padding=(0, 2))
+    table.add_column("Field", style="bold cyan")
+    table.add_column("Value")
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
     console.print()
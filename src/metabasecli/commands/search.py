@@ -5,32 +5,54 @@ cards, dashboards, collections, databases, tables, and more.
 """
 
 from collections import defaultdict
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
-from rich.table import Table
 
-from ..constants import SEARCHABLE_MODELS
+from ..constants import SEARCHABLE_MODELS, SEARCHABLE_MODELS_SET
 from ..context import get_context
-from ..logging import console
-from ..output import get_collection_path, handle_api_error, output_json
+from ..logging import console, error_console
+from ..output import get_collection_path, handle_api_error, output_error_json, output_json
 
+# Canonical display order for result groups; unknown model types sort last
+_MODEL_ORDER_INDEX = {m: i for i, m in enumerate(SEARCHABLE_MODELS)}
 
-def _print_model_group(model_type: str, items: list) -> None:
-    """Print a table of search results for a single model type."""
-    console.print(f"[bold cyan]{model_type.upper()}S ({len(items)})[/bold cyan]")
+if TYPE_CHECKING:
+    from rich.table import Table
+
+
+def _build_collection_path(item: dict) -> tuple[dict | None, list[str]]:
+    """Get an item's collection dict and its ancestor-name path in one pass."""
+    collection = item.get("collection")
+    if not collection:
+        return None, []
+    ancestors = collection.get("effective_ancestors") or ()
+    path = [name for a in ancestors if (name := a.get("name"))]
+    path.append(collection.get("name", ""))
+    return collection, path
+
+
+def _make_results_table() -> "Table":
+    """Create the ID/Name/Location table used for each result group."""
+    from rich.table import Table
 
     table = Table(show_header=True, header_style="bold")
     table.add_column("ID", style="cyan", justify="right", width=8)
     table.add_column("Name", style="green", min_width=20)
     table.add_column("Location", style="dim", min_width=30)
+    return table
+
+
+def _print_model_group(model_type: str, items: list) -> None:
+    """Print a table of search results for a single model type."""
+    console.print(f"[bold cyan]{model_type.upper()}S ({len(items)})[/bold cyan]")
 
+    table = _make_results_table()
+    add_row = table.add_row
+    build_path = get_collection_path
     for item in items:
-        table.add_row(
-            str(item.get("id", "")),
-            item.get("name", ""),
-            get_collection_path(item),
-        )
+        get = item.get
+        add_row(str(get("id", "")), get("name", ""), build_path(item))
 
     console.print(table)
     console.print()
@@ -73,14 +95,21 @@ def search_command(
     """Global search across all Metabase entities."""
     ctx = get_context()
 
+    # Parse and validate models if provided
+    model_list: list[str] | None = None
+    if models:
+        model_list = [m.strip() for m in models.split(",") if m.strip()]
+        if unknown_models := [m for m in model_list if m not in SEARCHABLE_MODELS_SET]:
+            msg = f"Unknown model type(s): {', '.join(unknown_models)}. Valid types: {', '.join(SEARCHABLE_MODELS)}"
+            if json_output:
+                output_error_json(code="VALIDATION_ERROR", message=msg)
+            else:
+                error_console.print(f"[red]{msg}[/red]")
+            raise typer.Exit(1)
+
     try:
         client = ctx.require_auth()
 
-        # Parse models if provided
-        model_list: list[str] | None = None
-        if models:
-            model_list = [m.strip() for m in models.split(",") if m.strip()]
-
         # Perform search
         results = client.search.search(
             query=query,
@@ -95,6 +124,14 @@ def search_command(
         data = results.get("data", [])
         total = results.get("total", len(data))
 
+        # Empty result sets skip all formatting work
+        if not data:
+            if json_output:
+                output_json({"query": query, "total_results": total, "results": []})
+            else:
+                console.print(f"[dim]No results found for '[/dim]{query}[dim]'[/dim]")
+            return
+
         if json_output:
             # Build JSON output
             formatted_results = []
@@ -107,11 +144,8 @@ def search_command(
                 }
 
                 # Add collection info if available
-                collection = item.get("collection")
+                collection, path = _build_collection_path(item)
                 if collection:
-                    ancestors = collection.get("effective_ancestors", [])
-                    path = [a.get("name", "") for a in ancestors if a.get("name")]
-                    path.append(collection.get("name", ""))
                     result_entry["collection"] = {
                         "id": collection.get("id"),
                         "name": collection.get("name"),
@@ -119,8 +153,8 @@ def search_command(
                     }
 
                 # Add updated_at if available
-                if item.get("updated_at"):
-                    result_entry["updated_at"] = item.get("updated_at")
+                if updated_at := item.get("updated_at"):
+                    result_entry["updated_at"] = updated_at
 
                 formatted_results.append(result_entry)
 
@@ -133,36 +167,26 @@ def search_command(
             )
         else:
             # Human-readable output grouped by model type
-            if not data:
-                console.print(f"[dim]No results found for '[/dim]{query}[dim]'[/dim]")
-                return
-
             # Group results by model type
             grouped: dict[str, list] = defaultdict(list)
             for item in data:
                 model_type = item.get("model", "unknown")
                 grouped[model_type].append(item)
 
+            # Order groups once: canonical order first, unknown types
+            # alphabetically last; the counts summary reuses the same order
+            order = _MODEL_ORDER_INDEX.get
+            unknown = len(SEARCHABLE_MODELS)
+            ordered_groups = sorted(grouped.items(), key=lambda kv: (order(kv[0], unknown), kv[0]))
+
             # Print summary
             console.print(f"\n[bold]Search results for '[/bold]{query}[bold]'[/bold]")
             console.print(f"[dim]Found {total} results[/dim]\n")
+            counts = ", ".join(f"{model_type}: {len(items)}" for model_type, items in ordered_groups)
+            console.print(f"[dim]By type: {counts}[/dim]\n")
 
-            # Print counts by type
-            type_counts = []
-            for model_type, items in sorted(grouped.items()):
-                type_counts.append(f"{model_type}: {len(items)}")
-            console.print(f"[dim]By type: {', '.join(type_counts)}[/dim]\n")
-
-            # Print each group in defined order
-            for model_type in SEARCHABLE_MODELS:
-                if model_type not in grouped:
-                    continue
-                _print_model_group(model_type, grouped[model_type])
-
-            # Print any remaining types not in the predefined order
-            remaining = set(grouped.keys()) - set(SEARCHABLE_MODELS)
-            for model_type in sorted(remaining):
-                _print_model_group(model_type, grouped[model_type])
+            for model_type, items in ordered_groups:
+                _print_model_group(model_type, items)
 
     except Exception as e:
         handle_api_error(e, json_output)
@@ -4,6 +4,7 @@ Handles loading and saving configuration from ~/.config/metabasecli/config.toml
 """
 
 import os
+import tomllib
 from pathlib import Path
 
 from .models.auth import AuthConfig, AuthMethod
@@ -21,6 +22,10 @@ __all__ = [
 DEFAULT_CONFIG_DIR = Path.home() / ".config" / "metabasecli"
 DEFAULT_CONFIG_FILE = DEFAULT_CONFIG_DIR / "config.toml"
 
+# Stringified once so hot paths skip Path's __fspath__ conversion
+_CONFIG_DIR_STR = str(DEFAULT_CONFIG_DIR)
+_CONFIG_FILE_STR = str(DEFAULT_CONFIG_FILE)
+
 # Environment variable names
 ENV_URL = "METABASE_URL"
 ENV_API_KEY = "METABASE_API_KEY"
@@ -28,11 +33,21 @@ ENV_SESSION_ID = "METABASE_SESSION_ID"
 ENV_USERNAME = "METABASE_USERNAME"
 ENV_PASSWORD = "METABASE_PASSWORD"
 
+# Value -> member lookup table; plain dict access beats the enum metaclass
+# __call__ that AuthMethod(value) goes through on every load_config
+_AUTH_METHOD_BY_VALUE = {m.value: m for m in AuthMethod}
+
 
 class ConfigError(Exception):
     """Raised when there's a configuration error."""
 
 
+# Parsed config files keyed by (path, mtime_ns). One CLI invocation can read
+# the config several times (initial load, session refresh, save); the cache
+# makes the repeats free and the mtime key drops stale entries automatically.
+_toml_cache: dict[tuple[str, int], dict] = {}
+
+
 def get_config_path() -> Path:
     """Get the path to the config file."""
     return DEFAULT_CONFIG_FILE
@@ -40,7 +55,7 @@ def get_config_path() -> Path:
 
 def ensure_config_dir() -> Path:
     """Ensure the config directory exists."""
-    DEFAULT_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    os.makedirs(_CONFIG_DIR_STR, exist_ok=True)
     return DEFAULT_CONFIG_DIR
 
 
@@ -68,42 +83,51 @@ def load_config(profile: str = "default") -> AuthConfig | None:
     return config
 
 
-def _load_file_config(profile: str) -> dict:
-    """Load configuration from the TOML file."""
-    config_path = get_config_path()
+def _load_raw_toml(config_path: Path) -> dict:
+    """Load the whole parsed config file through the mtime cache.
 
-    if not config_path.exists():
+    Returns the cached dict; callers that mutate it must copy first.
+    """
+    try:
+        stat = os.stat(config_path)
+    except FileNotFoundError:
         return {}
 
-    try:
-        import tomllib
+    cache_key = (str(config_path), stat.st_mtime_ns)
+    all_config = _toml_cache.get(cache_key)
+    if all_config is None:
+        try:
+            with open(config_path, "rb") as f:
+                all_config = tomllib.load(f)
+        except Exception as e:
+            raise ConfigError(f"Failed to load config file: {e}") from e
+        _toml_cache[cache_key] = all_config
 
-        with open(config_path, "rb") as f:
-            all_config = tomllib.load(f)
-            return all_config.get(profile, {})
-    except ImportError:
-        # Python < 3.11 fallback
-        import tomli
+    return all_config
 
-        with open(config_path, "rb") as f:
-            all_config = tomli.load(f)
-            return all_config.get(profile, {})
-    except Exception as e:
-        raise ConfigError(f"Failed to load config file: {e}") from e
+
+def _load_file_config(profile: str) -> dict:
+    """Load configuration from the TOML file."""
+    return _load_raw_toml(get_config_path()).get(profile, {})
 
 
 def _apply_env_overrides(file_config: dict) -> AuthConfig | None:
     """Apply environment variable overrides to file configuration."""
+    env = os.environ
+    fget = file_config.get
+
     # Get URL
-    url = os.environ.get(ENV_URL, file_config.get("url"))
+    url = env.get(ENV_URL) or fget("url")
     if not url:
         return None
 
-    # Determine auth method from environment or file
-    api_key = os.environ.get(ENV_API_KEY, file_config.get("api_key"))
-    session_id = os.environ.get(ENV_SESSION_ID, file_config.get("session_id"))
-    username = os.environ.get(ENV_USERNAME, file_config.get("username"))
-    password = os.environ.get(ENV_PASSWORD, file_config.get("password"))
+    # Determine auth method from environment or file; os.environ access is
+    # surprisingly heavy, and the lazy or-fallback also skips the file
+    # lookups that the eager .get defaults always paid for
+    api_key = env.get(ENV_API_KEY) or fget("api_key")
+    session_id = env.get(ENV_SESSION_ID) or fget("session_id")
+    username = env.get(ENV_USERNAME) or fget("username")
+    password = env.get(ENV_PASSWORD) or fget("password")
 
     # Determine auth method
     if api_key:
@@ -116,7 +140,9 @@ def _apply_env_overrides(file_config: dict) -> AuthConfig | None:
         # Check file config for explicit auth_method
         file_method = file_config.get("auth_method")
         if file_method:
-            auth_method = AuthMethod(file_method)
+            auth_method = _AUTH_METHOD_BY_VALUE.get(file_method)
+            if auth_method is None:
+                raise ConfigError(f"Unknown auth_method in config: {file_method}")
         else:
             return None
 
@@ -140,19 +166,8 @@ def save_config(config: AuthConfig, profile: str = "default") -> None:
     ensure_config_dir()
     config_path = get_config_path()
 
-    # Load existing config
-    existing = {}
-    if config_path.exists():
-        try:
-            import tomllib
-
-            with open(config_path, "rb") as f:
-                existing = tomllib.load(f)
-        except ImportError:
-            import tomli
-
-            with open(config_path, "rb") as f:
-                existing = tomli.load(f)
+    # Load existing config (cached copy; we are about to mutate it)
+    existing = dict(_load_raw_toml(config_path))
 
     # Update profile
     profile_config = {
@@ -181,14 +196,33 @@ def _write_toml(path: Path, data: dict) -> None:
 
     with open(path, "wb") as f:
         tomli_w.dump(data, f)
+    # The file changed on disk; drop any cached parses
+    _toml_cache.clear()
 
 
-def update_session_id(session_id: str, profile: str = "default") -> None:
+def update_session_id(session_id: str, *, profile: str = "default", config: AuthConfig | None = None) -> None:
     """Update just the session_id in the config file.
 
-    This is used for auto-refresh of session tokens.
+    This is used for auto-refresh of session tokens. Patches the stored
+    profile table directly instead of round-tripping through load_config
+    and AuthConfig reconstruction; profiles that only exist via environment
+    variables are left alone.
+
+    Args:
+        session_id: The new session token.
+        profile: Profile to patch; ignored when config is given.
+        config: The caller's in-memory AuthConfig, if it already holds one.
+            It is kept in sync and its profile is used for the file patch,
+            so no config re-parse is needed.
     """
-    config = load_config(profile)
-    if config:
+    if config is not None:
         config.session_id = session_id
-        save_config(config, profile)
+        profile = config.profile
+
+    config_path = get_config_path()
+    existing = dict(_load_raw_toml(config_path))
+    profile_config = existing.get(profile)
+    if not profile_config:
+        return
+    existing[profile] = {**profile_config, "session_id": session_id}
+    _write_toml(config_path, existing)
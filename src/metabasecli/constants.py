@@ -17,6 +17,7 @@ __all__ = [
     "MODEL_SEGMENT",
     "MODEL_ACTION",
     "SEARCHABLE_MODELS",
+    "SEARCHABLE_MODELS_SET",
 ]
 
 # Export file format version
@@ -48,3 +49,6 @@ SEARCHABLE_MODELS = [
     MODEL_SEGMENT,
     MODEL_ACTION,
 ]
+
+# Same set for O(1) membership checks; the list keeps display order
+SEARCHABLE_MODELS_SET: frozenset[str] = frozenset(SEARCHABLE_MODELS)
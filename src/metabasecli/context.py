@@ -4,7 +4,6 @@ Provides a shared context object that holds configuration and client instances
 across all CLI commands.
 """
 
-from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -14,14 +13,21 @@ if TYPE_CHECKING:
 __all__ = ["Context", "get_context"]
 
 
-@dataclass
 class Context:
-    """CLI context passed to all commands."""
+    """CLI context passed to all commands.
 
-    verbose: bool = False
-    profile: str = "default"
-    _config: "AuthConfig | None" = field(default=None, repr=False)
-    _client: "MetabaseClient | None" = field(default=None, repr=False)
+    A plain slotted class rather than a dataclass: exactly one instance
+    exists and its attributes are read on every command, so slot access
+    beats a per-instance __dict__.
+    """
+
+    __slots__ = ("verbose", "profile", "_config", "_client")
+
+    def __init__(self) -> None:
+        self.verbose = False
+        self.profile = "default"
+        self._config: AuthConfig | None = None
+        self._client: MetabaseClient | None = None
 
     @property
     def config(self) -> "AuthConfig | None":
@@ -45,15 +51,16 @@ class Context:
         Raises:
             RuntimeError: If no configuration is available.
         """
-        if self._client is None:
+        client = self._client
+        if client is None:
             config = self.config
             if config is None:
                 raise RuntimeError("Not authenticated. Run 'metabase auth login' first or set environment variables.")
 
             from .client import MetabaseClient
 
-            self._client = MetabaseClient(config)
-        return self._client
+            client = self._client = MetabaseClient(config)
+        return client
 
     @property
     def api_call_count(self) -> int:
@@ -19,7 +19,7 @@ class AuthMethod(StrEnum):
     CREDENTIALS = "credentials"
 
 
-@dataclass
+@dataclass(slots=True)
 class AuthConfig:
     """Authentication configuration."""
 
@@ -38,7 +38,7 @@ class AuthConfig:
     password: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionInfo:
     """Information about the current session."""
 
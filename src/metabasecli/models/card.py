@@ -12,7 +12,7 @@ from ..utils import parse_datetime
 __all__ = ["VisualizationSettings", "CardQuery", "Card"]
 
 
-@dataclass
+@dataclass(slots=True)
 class VisualizationSettings:
     """Settings for how a card's results are displayed."""
 
@@ -20,7 +20,7 @@ class VisualizationSettings:
     settings: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class CardQuery:
     """The query definition for a card."""
 
@@ -35,7 +35,7 @@ class CardQuery:
     mbql_query: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Card:
     """A Metabase card (saved question/query)."""
 
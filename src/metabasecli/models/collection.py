@@ -11,8 +11,38 @@ from ..utils import parse_datetime
 
 __all__ = ["Collection", "CollectionItem"]
 
+# Keys broken out into dataclass fields; everything else lands in `extra`.
+_COLLECTION_CORE_KEYS: frozenset[str] = frozenset(
+    {
+        "id",
+        "name",
+        "description",
+        "archived",
+        "parent_id",
+        "location",
+        "personal_owner_id",
+        "created_at",
+        "updated_at",
+        "effective_ancestors",
+    }
+)
 
-@dataclass
+_COLLECTION_ITEM_CORE_KEYS: frozenset[str] = frozenset(
+    {
+        "id",
+        "name",
+        "model",
+        "description",
+        "collection_id",
+        "archived",
+        "created_at",
+        "updated_at",
+        "last_editor",
+    }
+)
+
+
+@dataclass(slots=True)
 class Collection:
     """A Metabase collection (folder for organizing items)."""
 
@@ -33,44 +63,34 @@ class Collection:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Collection":
         """Create a Collection from an API response dictionary."""
-        # Build path from effective_ancestors if available
-        ancestors = data.get("effective_ancestors", [])
-        path = [a.get("name", "") for a in ancestors if a.get("name")]
-        path_ids = [a.get("id") for a in ancestors if a.get("id")]
+        g = data.get
+        # Build path from effective_ancestors if available; one pass builds
+        # both lists instead of walking the ancestors twice
+        path: list[str] = []
+        path_ids: list[int] = []
+        for a in g("effective_ancestors", ()):
+            if name := a.get("name"):
+                path.append(name)
+            if ancestor_id := a.get("id"):
+                path_ids.append(ancestor_id)
 
         return cls(
-            id=data.get("id", 0),
-            name=data.get("name", ""),
-            description=data.get("description"),
-            archived=data.get("archived", False),
-            parent_id=data.get("parent_id"),
-            location=data.get("location"),
-            personal_owner_id=data.get("personal_owner_id"),
-            created_at=parse_datetime(data.get("created_at")),
-            updated_at=parse_datetime(data.get("updated_at")),
+            id=g("id", 0),
+            name=g("name", ""),
+            description=g("description"),
+            archived=g("archived", False),
+            parent_id=g("parent_id"),
+            location=g("location"),
+            personal_owner_id=g("personal_owner_id"),
+            created_at=parse_datetime(g("created_at")),
+            updated_at=parse_datetime(g("updated_at")),
             path=path,
             path_ids=path_ids,
-            extra={
-                k: v
-                for k, v in data.items()
-                if k
-                not in {
-                    "id",
-                    "name",
-                    "description",
-                    "archived",
-                    "parent_id",
-                    "location",
-                    "personal_owner_id",
-                    "created_at",
-                    "updated_at",
-                    "effective_ancestors",
-                }
-            },
+            extra={k: data[k] for k in data.keys() - _COLLECTION_CORE_KEYS},
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CollectionItem:
     """An item within a collection (card, dashboard, etc.)."""
 
@@ -88,36 +108,22 @@ class CollectionItem:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "CollectionItem":
         """Create a CollectionItem from an API response dictionary."""
+        g = data.get
         # Get last edited by from nested user object if present
         last_edited_by = None
-        last_editor = data.get("last_editor")
+        last_editor = g("last_editor")
         if last_editor and isinstance(last_editor, dict):
             last_edited_by = last_editor.get("email") or last_editor.get("common_name")
 
         return cls(
-            id=data.get("id", 0),
-            name=data.get("name", ""),
-            model=data.get("model", ""),
-            description=data.get("description"),
-            collection_id=data.get("collection_id"),
-            archived=data.get("archived", False),
-            created_at=parse_datetime(data.get("created_at")),
-            updated_at=parse_datetime(data.get("updated_at")),
+            id=g("id", 0),
+            name=g("name", ""),
+            model=g("model", ""),
+            description=g("description"),
+            collection_id=g("collection_id"),
+            archived=g("archived", False),
+            created_at=parse_datetime(g("created_at")),
+            updated_at=parse_datetime(g("updated_at")),
             last_edited_by=last_edited_by,
-            extra={
-                k: v
-                for k, v in data.items()
-                if k
-                not in {
-                    "id",
-                    "name",
-                    "model",
-                    "description",
-                    "collection_id",
-                    "archived",
-                    "created_at",
-                    "updated_at",
-                    "last_editor",
-                }
-            },
+            extra={k: data[k] for k in data.keys() - _COLLECTION_ITEM_CORE_KEYS},
         )
@@ -3,7 +3,7 @@
 Contains dataclasses for Metabase dashboards and dashboard cards.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from typing import Any
 
@@ -12,7 +12,7 @@ from ..utils import parse_datetime
 __all__ = ["DashCard", "Dashboard"]
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class DashCard:
     """A card placement on a dashboard."""
 
@@ -45,25 +45,16 @@ class DashCard:
             size_y=data.get("size_y", 4),
             parameter_mappings=data.get("parameter_mappings", []),
             visualization_settings=data.get("visualization_settings", {}),
-            extra={
-                k: v
-                for k, v in data.items()
-                if k
-                not in {
-                    "id",
-                    "card_id",
-                    "row",
-                    "col",
-                    "size_x",
-                    "size_y",
-                    "parameter_mappings",
-                    "visualization_settings",
-                }
-            },
+            extra={k: data[k] for k in data.keys() - _DASHCARD_KNOWN},
         )
 
 
-@dataclass
+# Derived from the declared fields so the exclusion set tracks the class
+# automatically; everything not listed there lands in `extra`.
+_DASHCARD_KNOWN = frozenset(f.name for f in fields(DashCard) if f.name != "extra")
+
+
+@dataclass(slots=True, kw_only=True)
 class Dashboard:
     """A Metabase dashboard."""
 
@@ -82,28 +73,30 @@ class Dashboard:
     collection_name: str | None = None
     collection_path: list[str] = field(default_factory=list)
 
-    # Referenced cards (populated with --include-cards)
-    referenced_cards: dict[int, dict[str, Any]] = field(default_factory=dict)
-
     # Raw API response for export
     raw_data: dict[str, Any] = field(default_factory=dict)
     extra: dict[str, Any] = field(default_factory=dict)
 
+    # Memoized result of get_unique_card_ids()
+    _unique_card_ids: list[int] | None = field(default=None, repr=False)
+
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "Dashboard":
+    def from_dict(cls, data: dict[str, Any], store_raw: bool = True) -> "Dashboard":
         """Create a Dashboard instance from an API response dictionary.
 
         Args:
             data: Dictionary from Metabase API response.
+            store_raw: Keep a reference to the full response in raw_data.
+                Pass False on list/browse paths that never export, so the
+                response dict can be garbage collected.
 
         Returns:
             Dashboard instance with populated fields.
         """
-        # Parse dashcards
-        dashcards = []
-        ordered_cards = data.get("ordered_cards") or data.get("dashcards") or []
-        for dc in ordered_cards:
-            dashcards.append(DashCard.from_dict(dc))
+        # Parse dashcards; () as the final fallback avoids allocating a
+        # list per dashboard on the common empty case
+        ordered_cards = data.get("ordered_cards") or data.get("dashcards") or ()
+        dashcards = [DashCard.from_dict(dc) for dc in ordered_cards]
 
         # Parse dates
         created_at = parse_datetime(data.get("created_at"))
@@ -125,7 +118,7 @@ class Dashboard:
             created_at=created_at,
             updated_at=updated_at,
             collection_name=collection_name,
-            raw_data=data,
+            raw_data=data if store_raw else {},
         )
 
     def get_unique_card_ids(self) -> list[int]:
@@ -133,11 +126,12 @@ class Dashboard:
 
         Filters out dashcards without a card_id (text cards, heading cards, etc.)
 
+        The result is memoized since callers often need it more than once
+        per dashboard.
+
         Returns:
             List of unique card IDs.
         """
-        card_ids = set()
-        for dashcard in self.dashcards:
-            if dashcard.card_id is not None:
-                card_ids.add(dashcard.card_id)
-        return sorted(card_ids)
+        if self._unique_card_ids is None:
+            self._unique_card_ids = sorted({dc.card_id for dc in self.dashcards if dc.card_id is not None})
+        return self._unique_card_ids
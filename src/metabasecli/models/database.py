@@ -3,13 +3,14 @@
 Contains dataclasses for Metabase database, table, and field objects.
 """
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
 from typing import Any
 
 __all__ = ["Field", "Table", "Database"]
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class Field:
     """A field (column) in a Metabase table."""
 
@@ -31,32 +32,26 @@ class Field:
             id=data["id"],
             name=data["name"],
             display_name=data.get("display_name", data["name"]),
-            base_type=data.get("base_type", ""),
+            # Interned: a large instance repeats the same handful of type
+            # strings across tens of thousands of fields, and the JSON
+            # parser allocates a fresh copy per occurrence
+            # Falsy guards also cover explicit nulls, which .get defaults miss
+            base_type=sys.intern(v) if (v := data.get("base_type")) else "",
             table_id=data.get("table_id"),
-            semantic_type=data.get("semantic_type"),
+            semantic_type=sys.intern(v) if (v := data.get("semantic_type")) else None,
             description=data.get("description"),
-            visibility_type=data.get("visibility_type", "normal"),
+            visibility_type=sys.intern(v) if (v := data.get("visibility_type")) else "normal",
             active=data.get("active", True),
-            extra={
-                k: v
-                for k, v in data.items()
-                if k
-                not in {
-                    "id",
-                    "name",
-                    "display_name",
-                    "base_type",
-                    "table_id",
-                    "semantic_type",
-                    "description",
-                    "visibility_type",
-                    "active",
-                }
-            },
+            extra={k: data[k] for k in data.keys() - _FIELD_KNOWN},
         )
 
 
-@dataclass
+# Known-key sets derived from the declared fields so they track the
+# classes automatically; everything not listed there lands in `extra`.
+_FIELD_KNOWN = frozenset(f.name for f in fields(Field) if f.name != "extra")
+
+
+@dataclass(slots=True, kw_only=True)
 class Table:
     """A table in a Metabase database."""
 
@@ -87,26 +82,14 @@ class Table:
             visibility_type=data.get("visibility_type", "normal"),
             active=data.get("active", True),
             fields=fields,
-            extra={
-                k: v
-                for k, v in data.items()
-                if k
-                not in {
-                    "id",
-                    "name",
-                    "display_name",
-                    "db_id",
-                    "schema",
-                    "description",
-                    "visibility_type",
-                    "active",
-                    "fields",
-                }
-            },
+            extra={k: data[k] for k in data.keys() - _TABLE_KNOWN},
         )
 
 
-@dataclass
+_TABLE_KNOWN = frozenset(f.name for f in fields(Table) if f.name != "extra")
+
+
+@dataclass(slots=True, kw_only=True)
 class Database:
     """A Metabase database connection."""
 
@@ -129,24 +112,14 @@ class Database:
         return cls(
             id=data["id"],
             name=data["name"],
-            engine=data.get("engine", ""),
+            engine=sys.intern(v) if (v := data.get("engine")) else "",
             description=data.get("description"),
             details=data.get("details", {}),
             is_sample=data.get("is_sample", False),
             tables_count=len(tables) if tables else data.get("tables", 0),
             tables=tables,
-            extra={
-                k: v
-                for k, v in data.items()
-                if k
-                not in {
-                    "id",
-                    "name",
-                    "engine",
-                    "description",
-                    "details",
-                    "is_sample",
-                    "tables",
-                }
-            },
+            extra={k: data[k] for k in data.keys() - _DATABASE_KNOWN},
         )
+
+
+_DATABASE_KNOWN = frozenset(f.name for f in fields(Database) if f.name != "extra")
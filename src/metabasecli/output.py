@@ -4,11 +4,17 @@ This module provides functions for formatting CLI output, writing export files,
 and handling API errors consistently across all commands.
 """
 
-import json
-from datetime import datetime
+import errno
+import os
+import sys
+import tempfile
+from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from .client.base import (
     AuthenticationError,
     MetabaseAPIError,
@@ -21,26 +27,84 @@ from .logging import console, error_console
 
 __all__ = [
     "create_export_dir",
+    "create_export_staging_dir",
+    "export_dir_target",
+    "finalize_export_dir",
     "write_json_file",
     "write_export_file",
     "write_csv_file",
     "output_json",
     "output_error_json",
+    "utcnow_z",
     "handle_api_error",
     "get_collection_path",
     "get_collection_path_parts",
 ]
 
+# Shared serializer setup: one bound dumps and one precomputed option
+# mask for every file/stdout JSON path in this module, so the pieces
+# aren't re-spelled (and re-evaluated) per call site
+_dumps = orjson.dumps
+_FILE_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_UTC_Z
+
+
+def utcnow_z() -> str:
+    """Current UTC time as an ISO string with a literal Z suffix.
+
+    strftime with the Z baked into the format string builds the
+    timestamp in one allocation instead of isoformat() plus a concat.
+    """
+    return datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def export_dir_target() -> Path:
+    """Return a new timestamped export directory path without creating it.
+
+    Returns a path like /tmp/metabase-20260205-183500/
+    """
+    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    return Path(f"/tmp/metabase-{timestamp}")
+
 
 def create_export_dir() -> Path:
     """Create and return a timestamped export directory.
 
-    Creates a directory like /tmp/metabase-20260205-183500/
+    Creates a directory like /tmp/metabase-20260205-183500-abc123/.
+    mkdtemp creates it with a single exclusive mkdir, so concurrent CLI
+    invocations started in the same second never share a directory.
     """
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-    dir_path = Path(f"/tmp/metabase-{timestamp}")
-    dir_path.mkdir(parents=True, exist_ok=True)
-    return dir_path
+    return Path(tempfile.mkdtemp(prefix=f"metabase-{timestamp}-", dir="/tmp"))
+
+
+def create_export_staging_dir() -> Path:
+    """Create a private staging directory for an in-progress export.
+
+    Files are written here first and the directory is moved into place with
+    a single rename by finalize_export_dir, so a failed export never leaves
+    a half-written directory at the final location.
+    """
+    return Path(tempfile.mkdtemp(prefix=".metabase-export-", dir="/tmp"))
+
+
+def finalize_export_dir(staging_dir: Path, final_dir: Path) -> Path:
+    """Atomically move a completed staging directory to its final location.
+
+    When another export already claimed the target (two invocations in the
+    same second), falls back to a numbered sibling like
+    /tmp/metabase-20260205-183500-2/. Returns the directory actually used.
+    """
+    target = final_dir
+    attempt = 1
+    while True:
+        try:
+            os.replace(staging_dir, target)
+            return target
+        except OSError as e:
+            if e.errno not in (errno.EEXIST, errno.ENOTEMPTY):
+                raise
+            attempt += 1
+            target = final_dir.with_name(f"{final_dir.name}-{attempt}")
 
 
 def write_json_file(dir_path: Path, filename: str, data: dict) -> Path:
@@ -55,7 +119,7 @@ def write_json_file(dir_path: Path, filename: str, data: dict) -> Path:
         Full path to the written file.
     """
     file_path = dir_path / filename
-    file_path.write_text(json.dumps(data, indent=2, default=str))
+    file_path.write_bytes(_dumps(data, option=_FILE_OPTS, default=str))
     return file_path
 
 
@@ -80,12 +144,14 @@ def write_export_file(
     """
     export_data = {
         "export_version": EXPORT_VERSION,
-        "export_timestamp": datetime.now().isoformat() + "Z",
+        "export_timestamp": datetime.now(UTC),
         "type": export_type,
         "source": source_info or {},
         export_type: data,
     }
-    return write_json_file(dir_path, filename, export_data)
+    file_path = dir_path / filename
+    file_path.write_bytes(_dumps(export_data, option=_FILE_OPTS, default=str))
+    return file_path
 
 
 def write_csv_file(
@@ -108,13 +174,29 @@ def write_csv_file(
     import csv
 
     file_path = dir_path / filename
-    with open(file_path, "w", newline="") as f:
+    # 1 MiB buffer so large result sets flush in few write() syscalls;
+    # explicit utf-8 avoids locale-dependent encoding
+    with open(file_path, "w", newline="", buffering=1 << 20, encoding="utf-8") as f:
         writer = csv.writer(f)
         writer.writerow(headers)
         writer.writerows(rows)
     return file_path
 
 
+def _emit_json(envelope: dict) -> None:
+    """Print a response envelope as JSON.
+
+    Rich's print_json re-parses the serialized string to syntax-highlight
+    it, which is only worth paying for on a terminal; piped output goes
+    straight to stdout as orjson-formatted bytes.
+    """
+    if console.is_terminal:
+        console.print_json(_dumps(envelope, default=str).decode())
+    else:
+        sys.stdout.write(_dumps(envelope, option=orjson.OPT_INDENT_2, default=str).decode())
+        sys.stdout.write("\n")
+
+
 def output_json(data: dict, success: bool = True) -> None:
     """Output data as JSON to stdout.
 
@@ -125,7 +207,7 @@ def output_json(data: dict, success: bool = True) -> None:
     from .context import get_context
 
     meta: dict[str, Any] = {
-        "timestamp": datetime.now().isoformat() + "Z",
+        "timestamp": utcnow_z(),
     }
 
     ctx = get_context()
@@ -138,7 +220,7 @@ def output_json(data: dict, success: bool = True) -> None:
         "data": data,
         "meta": meta,
     }
-    console.print_json(json.dumps(envelope, default=str))
+    _emit_json(envelope)
 
 
 def output_error_json(
@@ -156,7 +238,7 @@ def output_error_json(
     }
     if details:
         envelope["error"]["details"] = details
-    console.print_json(json.dumps(envelope, default=str))
+    _emit_json(envelope)
 
 
 def handle_api_error(e: Exception, json_output: bool, entity_name: str = "Resource") -> None:
@@ -238,6 +320,16 @@ def get_collection_path(item_or_collection: dict) -> str:
     return " / ".join(path_parts)
 
 
+@lru_cache(maxsize=512)
+def _joined_path(names: tuple[str, ...]) -> str:
+    """Join collection ancestor names into a /-separated path.
+
+    Cached because batch usage (resolving or listing many items in the
+    same collection) recomputes the identical path repeatedly.
+    """
+    return "/" + "/".join(names)
+
+
 def get_collection_path_parts(item_or_collection: dict) -> tuple[str, list[str]]:
     """Get the collection path as both a formatted string and list of parts.
 
@@ -260,9 +352,9 @@ def get_collection_path_parts(item_or_collection: dict) -> tuple[str, list[str]]
     # Try to build path from effective_ancestors if available
     ancestors = collection.get("effective_ancestors", [])
     if ancestors:
-        path_parts = [a.get("name", "") for a in ancestors if a.get("name")]
-        path_parts.append(collection.get("name", ""))
-        return ("/" + "/".join(path_parts), path_parts)
+        names = [name for a in ancestors if (name := a.get("name"))]
+        names.append(collection.get("name", ""))
+        return (_joined_path(tuple(names)), names)
 
     # Fallback to just collection name
     name = collection.get("name", "Root Collection")
@@ -1,10 +1,13 @@
 """Shared utility functions for the Metabase CLI."""
 
-import contextlib
 from datetime import datetime
 
 __all__ = ["parse_datetime"]
 
+# Bound once; parse_datetime runs per timestamp field across potentially
+# thousands of API records, so skip the attribute lookup per call
+_fromisoformat = datetime.fromisoformat
+
 
 def parse_datetime(value: str | None) -> datetime | None:
     """Parse an ISO datetime string, returning None on failure.
@@ -19,6 +22,9 @@ def parse_datetime(value: str | None) -> datetime | None:
     """
     if not value:
         return None
-    with contextlib.suppress(ValueError, AttributeError):
-        return datetime.fromisoformat(value.replace("Z", "+00:00"))
-    return None
+    try:
+        # fromisoformat parses the trailing Z natively on Python 3.11+
+        # (the project floor), so no suffix rewrite is needed
+        return _fromisoformat(value)
+    except (ValueError, TypeError):
+        return None